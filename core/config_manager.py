@@ -12,6 +12,11 @@ import json
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson  # C-Parser, 3-10x schneller als Stdlib-json
+except ImportError:  # optional – Stdlib-json genügt funktional
+    orjson = None
+
 # Standardwerte – werden verwendet, wenn config.json fehlt oder unvollständig ist.
 DEFAULT_CONFIG = {
     "language": "de",
@@ -40,23 +45,56 @@ class ConfigManager:
     def __init__(self, config_path: Path):
         self.config_path = config_path
         self.data: dict = dict(DEFAULT_CONFIG)
+        # mtime des zuletzt geparsten Stands – erlaubt reload_if_changed,
+        # mit einem stat statt eines JSON-Parse zu entscheiden
+        self._mtime: float = 0.0
         self.load()
 
     def load(self):
         """Konfiguration aus der JSON-Datei lesen (falls vorhanden)."""
         if self.config_path.exists():
             try:
-                with open(self.config_path, "r", encoding="utf-8") as fh:
-                    loaded = json.load(fh)
+                self._mtime = self.config_path.stat().st_mtime
+                raw = self.config_path.read_bytes()
+                if orjson is not None:
+                    loaded = orjson.loads(raw)
+                else:
+                    loaded = json.loads(raw.decode("utf-8"))
                 self.data.update(loaded)
-            except (json.JSONDecodeError, IOError):
+            except (ValueError, IOError):
                 pass  # Bei Fehler: Standardwerte beibehalten
 
     def save(self):
         """Aktuelle Konfiguration als JSON auf den Stick schreiben."""
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.config_path, "w", encoding="utf-8") as fh:
-            json.dump(self.data, fh, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            self.config_path.write_bytes(
+                orjson.dumps(self.data, option=orjson.OPT_INDENT_2)
+            )
+        else:
+            with open(self.config_path, "w", encoding="utf-8") as fh:
+                json.dump(self.data, fh, indent=2, ensure_ascii=False)
+        try:
+            self._mtime = self.config_path.stat().st_mtime
+        except OSError:
+            pass
+
+    def reload_if_changed(self) -> bool:
+        """Config neu einlesen, falls die Datei extern geändert wurde.
+
+        Vergleicht nur die mtime (ein stat-Aufruf); erst bei Abweichung
+        wird tatsächlich geparst.  Gibt ``True`` zurück, wenn neu
+        geladen wurde.
+        """
+        try:
+            mtime = self.config_path.stat().st_mtime
+        except OSError:
+            return False
+        if mtime == self._mtime:
+            return False
+        self.data = dict(DEFAULT_CONFIG)
+        self.load()
+        return True
 
     def get(self, key: str, default: Any = None) -> Any:
         """Einzelnen Konfigurationswert auslesen."""
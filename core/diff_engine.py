@@ -14,11 +14,37 @@ from __future__ import annotations
 
 import fnmatch
 import hashlib
+import json
+import mmap
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import Enum
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Optional
 
+# dataclass(slots=True) gibt es erst ab Python 3.10; auf 3.9 (laut
+# README weiterhin unterstützt) entfällt nur die __dict__-Ersparnis,
+# das Verhalten bleibt identisch
+if sys.version_info >= (3, 10):
+    _slots_dataclass = dataclass(slots=True)
+else:
+    _slots_dataclass = dataclass
+
+try:
+    # BLAKE3 ist als reiner Inhalts-Fingerabdruck 5-10x schneller als
+    # SHA-256 (SIMD, gibt den GIL frei); kryptografische Anforderungen
+    # gibt es hier nicht
+    from blake3 import blake3 as _blake3
+except ImportError:  # optional – SHA-256 aus der Stdlib genügt
+    _blake3 = None
+
+# Algorithmusname wandert in die Cache-Schlüssel, damit alte
+# SHA-256-Einträge nicht mit BLAKE3-Hashes verwechselt werden
+_HASH_ALGO = "blake3" if _blake3 is not None else "sha256"
+
 
 class FileAction(Enum):
     """Mögliche Aktionen für eine Datei beim Backup."""
@@ -29,10 +55,16 @@ class FileAction(Enum):
     ERROR = "error"      # Datei konnte nicht gelesen/verglichen werden
 
 
-@dataclass
+@_slots_dataclass
 class FileEntry:
     """Beschreibt eine einzelne Datei im Diff-Ergebnis.
 
+    Die Pfade sind bewusst Strings: bei 100k+ Einträgen kostet jedes
+    Path-Objekt Speicher und jede str()-Konvertierung im Kopier- und
+    Anzeigepfad eine Allokation.  ``slots=True`` (ab Python 3.10) spart
+    zusätzlich das ``__dict__`` pro Instanz (~Halbierung des
+    Speicherbedarfs).
+
     Attribute:
         source_path:   Absoluter Quellpfad.
         relative_path: Relativer Pfad (inkl. Quellordner-Name).
@@ -40,15 +72,17 @@ class FileEntry:
         action:        Geplante Aktion (NEW / UPDATED / SKIPPED / ERROR).
         source_size:   Dateigröße in Bytes.
         source_mtime:  Letzter Änderungszeitpunkt (Unix-Timestamp).
+        source_ino:    Inode-Nummer (0, wo nicht verfügbar, z.B. Windows).
         reason:        Fehlerbeschreibung (nur bei ERROR).
     """
 
-    source_path: Path
-    relative_path: Path
-    target_path: Path
+    source_path: str
+    relative_path: str
+    target_path: str
     action: FileAction
     source_size: int = 0
     source_mtime: float = 0.0
+    source_ino: int = 0
     reason: str = ""
 
 
@@ -67,6 +101,27 @@ class DiffEngine:
     ):
         self.compare_method = compare_method
         self.excludes = excludes or []
+        # Alle Ausschlussmuster einmalig zu einem kombinierten Regex
+        # übersetzen – fnmatch würde sonst jedes Muster bei jedem Aufruf
+        # neu kompilieren.  Windows vergleicht Dateinamen ohne
+        # Groß-/Kleinschreibung, genau wie fnmatch.fnmatch es tat.
+        if self.excludes:
+            self._exclude_re: Optional[re.Pattern[str]] = re.compile(
+                "|".join(fnmatch.translate(p) for p in self.excludes),
+                re.IGNORECASE if os.name == "nt" else 0,
+            )
+        else:
+            self._exclude_re = None
+        # Hash-Cache: (Pfad, Größe, mtime_ns) -> Hexdigest.  Wird im
+        # Zielverzeichnis persistiert, damit Folge-Scans nur noch
+        # Metadaten lesen müssen statt jede Datei neu zu hashen.
+        self._hash_cache: dict[str, str] = {}
+        self._hash_cache_path: Optional[Path] = None
+        self._hash_cache_dirty = False
+        # Im aktuellen Lauf nachgefragte Schlüssel – alles andere ist
+        # veraltet (gelöschte/geänderte Dateien) und wird beim Speichern
+        # verworfen, sonst wächst die Cache-Datei unbegrenzt
+        self._hash_keys_used: set[str] = set()
 
     # ------------------------------------------------------------------
     def scan(
@@ -76,15 +131,25 @@ class DiffEngine:
         progress_callback: Optional[Callable[[str], None]] = None,
     ) -> list[FileEntry]:
         """Alle Quellverzeichnisse scannen und Diff-Liste erstellen."""
+        if self.compare_method == "hash":
+            self._load_hash_cache(target_base)
+
+        # Zielbaum einmalig sequenziell erfassen: ein Verzeichnislauf
+        # statt N verstreuter stat-Aufrufe auf dem (langsamen) Ziel
+        snapshot = self._snapshot_target(target_base)
+
         entries: list[FileEntry] = []
+        # Hash-Kandidaten (gleiche Größe, Hash noch nicht im Cache) werden
+        # erst gesammelt und nach dem Metadaten-Walk parallel gehasht
+        hash_pending: list[tuple[FileEntry, str, int, int, str, int, int]] = []
         for src_str in sources:
             src = Path(src_str)
             if not src.exists():
                 entries.append(
                     FileEntry(
-                        source_path=src,
-                        relative_path=Path(src.name),
-                        target_path=target_base,
+                        source_path=str(src),
+                        relative_path=src.name,
+                        target_path=str(target_base),
                         action=FileAction.ERROR,
                         reason=f"Source not found: {src_str}",
                     )
@@ -92,95 +157,339 @@ class DiffEngine:
                 continue
 
             src_name = src.name
-            for fp in src.rglob("*"):
-                if not fp.is_file():
-                    continue
-                if self._is_excluded(fp, src):
-                    continue
+            src_str = str(src)
+            prefix = len(src_str) + 1
+            target_root = os.path.join(str(target_base), src_name)
+
+            # Expliziter Stack mit os.scandir statt rglob: DirEntry liefert
+            # Dateityp und stat-Ergebnis direkt aus dem Verzeichnis-Read –
+            # ein Syscall pro Eintrag statt drei pro Path-Objekt.
+            stack: list[str] = [src_str]
+            while stack:
+                current = stack.pop()
                 try:
-                    rel = fp.relative_to(src)
-                    target = target_base / src_name / rel
-                    st = fp.stat()
-                    action = self._compare(fp, target, st)
-                    entries.append(
-                        FileEntry(
-                            source_path=fp,
-                            relative_path=Path(src_name) / rel,
-                            target_path=target,
-                            action=action,
-                            source_size=st.st_size,
-                            source_mtime=st.st_mtime,
-                        )
-                    )
-                except PermissionError:
-                    entries.append(
-                        FileEntry(
-                            source_path=fp,
-                            relative_path=Path(src_name) / fp.name,
-                            target_path=target_base,
-                            action=FileAction.ERROR,
-                            reason="Permission denied",
-                        )
-                    )
-                except Exception as exc:
-                    entries.append(
-                        FileEntry(
-                            source_path=fp,
-                            relative_path=Path(src_name) / fp.name,
-                            target_path=target_base,
-                            action=FileAction.ERROR,
-                            reason=str(exc),
-                        )
-                    )
-                if progress_callback:
-                    progress_callback(str(fp))
+                    dir_iter = os.scandir(current)
+                except OSError:
+                    continue  # Verzeichnis nicht lesbar: überspringen
+                with dir_iter:
+                    for de in dir_iter:
+                        if de.is_dir(follow_symlinks=False):
+                            # Ausgeschlossene Ordner (.git, node_modules …)
+                            # komplett überspringen statt hineinzusteigen
+                            if not self._is_excluded_dir(de.name):
+                                stack.append(de.path)
+                            continue
+                        if not de.is_file():
+                            continue
+                        # Im heißen Pfad nur mit Strings arbeiten – jede
+                        # Path-Verknüpfung alloziert ein neues Objekt.
+                        # Path wird erst für den fertigen FileEntry gebaut.
+                        rel_str = de.path[prefix:]
+                        if self._is_excluded(de.name, rel_str):
+                            continue
+                        try:
+                            target_str = os.path.join(target_root, rel_str)
+                            st = de.stat()
+                            tgt_info = snapshot.get(
+                                os.path.join(src_name, rel_str)
+                            )
+                            action = self._compare(
+                                de.path, target_str, st, tgt_info
+                            )
+                            entry = FileEntry(
+                                source_path=de.path,
+                                relative_path=os.path.join(src_name, rel_str),
+                                target_path=target_str,
+                                action=action or FileAction.SKIPPED,
+                                source_size=st.st_size,
+                                source_mtime=st.st_mtime,
+                                source_ino=st.st_ino,
+                            )
+                            entries.append(entry)
+                            if action is None:
+                                hash_pending.append(
+                                    (
+                                        entry,
+                                        de.path,
+                                        st.st_size,
+                                        st.st_mtime_ns,
+                                        target_str,
+                                        tgt_info[0],
+                                        tgt_info[2],
+                                    )
+                                )
+                        except PermissionError:
+                            entries.append(
+                                FileEntry(
+                                    source_path=de.path,
+                                    relative_path=os.path.join(
+                                        src_name, de.name
+                                    ),
+                                    target_path=str(target_base),
+                                    action=FileAction.ERROR,
+                                    reason="Permission denied",
+                                )
+                            )
+                        except Exception as exc:
+                            entries.append(
+                                FileEntry(
+                                    source_path=de.path,
+                                    relative_path=os.path.join(
+                                        src_name, de.name
+                                    ),
+                                    target_path=str(target_base),
+                                    action=FileAction.ERROR,
+                                    reason=str(exc),
+                                )
+                            )
+                        if progress_callback:
+                            progress_callback(de.path)
+
+        if hash_pending:
+            self._resolve_pending_hashes(hash_pending, progress_callback)
+        if self.compare_method == "hash":
+            self._save_hash_cache()
         return entries
 
     # ------------------------------------------------------------------
-    def _compare(self, source: Path, target: Path, src_stat) -> FileAction:
-        """Einzelne Datei vergleichen und passende Aktion bestimmen."""
-        if not target.exists():
-            return FileAction.NEW
+    def _compare(
+        self,
+        source: str,
+        target: str,
+        src_stat,
+        tgt_info: Optional[tuple[int, float, int]],
+    ) -> Optional[FileAction]:
+        """Einzelne Datei vergleichen und passende Aktion bestimmen.
 
-        tgt_stat = target.stat()
+        ``tgt_info`` stammt aus dem Ziel-Snapshot (Größe, mtime,
+        mtime_ns) – ``None`` bedeutet: Datei existiert im Ziel nicht.
+        Gibt ``None`` zurück, wenn die Entscheidung erst nach dem
+        (parallelen) Hashen fallen kann.
+        """
+        if tgt_info is None:
+            return FileAction.NEW
+        tgt_size, tgt_mtime, tgt_mtime_ns = tgt_info
 
         if self.compare_method == "hash":
-            if self._file_hash(source) != self._file_hash(target):
+            # Unterschiedliche Größe -> Inhalt kann nicht identisch sein,
+            # beide Hash-Berechnungen entfallen
+            if src_stat.st_size != tgt_size:
+                return FileAction.UPDATED
+            src_key = self._hash_key(
+                source, src_stat.st_size, src_stat.st_mtime_ns
+            )
+            tgt_key = self._hash_key(target, tgt_size, tgt_mtime_ns)
+            self._hash_keys_used.add(src_key)
+            self._hash_keys_used.add(tgt_key)
+            src_hash = self._hash_cache.get(src_key)
+            tgt_hash = self._hash_cache.get(tgt_key)
+            if src_hash is None or tgt_hash is None:
+                return None  # Hash fehlt – wird nach dem Walk berechnet
+            if src_hash != tgt_hash:
                 return FileAction.UPDATED
             return FileAction.SKIPPED
 
         # Standard: Zeitstempel + Größe
-        if src_stat.st_size != tgt_stat.st_size:
+        if src_stat.st_size != tgt_size:
             return FileAction.UPDATED
         # 1 Sekunde Toleranz wegen FAT32-Zeitstempelauflösung (2s)
-        if src_stat.st_mtime > tgt_stat.st_mtime + 1:
+        if src_stat.st_mtime > tgt_mtime + 1:
             return FileAction.UPDATED
         return FileAction.SKIPPED
 
     # ------------------------------------------------------------------
-    def _is_excluded(self, file_path: Path, source_root: Path) -> bool:
+    @staticmethod
+    def _snapshot_target(target_base: Path) -> dict[str, tuple[int, float, int]]:
+        """Metadaten aller Dateien unterhalb des Ziels einsammeln.
+
+        Gibt ``{relativer Pfad: (Größe, mtime, mtime_ns)}`` zurück.
+        Ein sequenzieller scandir-Lauf über das Ziel ist deutlich
+        billiger als N wahlfreie stat-Aufrufe während des Vergleichs.
+        """
+        base_str = str(target_base)
+        prefix = len(base_str) + 1
+        snapshot: dict[str, tuple[int, float, int]] = {}
+        stack = [base_str]
+        while stack:
+            current = stack.pop()
+            try:
+                dir_iter = os.scandir(current)
+            except OSError:
+                continue
+            with dir_iter:
+                for de in dir_iter:
+                    if de.is_dir(follow_symlinks=False):
+                        stack.append(de.path)
+                    elif de.is_file():
+                        try:
+                            st = de.stat()
+                        except OSError:
+                            continue
+                        snapshot[de.path[prefix:]] = (
+                            st.st_size,
+                            st.st_mtime,
+                            st.st_mtime_ns,
+                        )
+        return snapshot
+
+    # ------------------------------------------------------------------
+    def _resolve_pending_hashes(
+        self,
+        pending: list[tuple[FileEntry, str, int, int, str, int, int]],
+        progress_callback: Optional[Callable[[str], None]] = None,
+    ):
+        """Fehlende Hashes parallel berechnen und Aktionen auflösen.
+
+        hashlib gibt den GIL während des Hashens frei, und Quelle und
+        Ziel liegen im Normalfall auf verschiedenen Geräten (interne
+        Platte vs. USB-Stick) – mehrere Threads überlappen daher sowohl
+        die Lesezugriffe beider Geräte als auch die open-Latenzen.
+        Bewusst Threads statt Prozesse: ein Prozess-Pool müsste jeden
+        Pfad picklen und brächte nichts, da der Engpass I/O ist und
+        hashlib/blake3 ohnehin parallel rechnen können.
+        """
+        # Pro (Pfad, Größe, mtime) nur einmal hashen
+        jobs: dict[str, str] = {}
+        for _e, s_path, s_size, s_mns, t_path, t_size, t_mns in pending:
+            jobs.setdefault(self._hash_key(s_path, s_size, s_mns), s_path)
+            jobs.setdefault(self._hash_key(t_path, t_size, t_mns), t_path)
+
+        failures: dict[str, str] = {}
+        workers = min(4, os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(self._file_hash, path): key
+                for key, path in jobs.items()
+            }
+            for fut in as_completed(futures):
+                key = futures[fut]
+                try:
+                    self._hash_cache[key] = fut.result()
+                    self._hash_cache_dirty = True
+                except OSError as exc:
+                    failures[key] = str(exc)
+                if progress_callback:
+                    progress_callback(jobs[key])
+
+        for entry, s_path, s_size, s_mns, t_path, t_size, t_mns in pending:
+            src_key = self._hash_key(s_path, s_size, s_mns)
+            tgt_key = self._hash_key(t_path, t_size, t_mns)
+            src_hash = self._hash_cache.get(src_key)
+            tgt_hash = self._hash_cache.get(tgt_key)
+            if src_hash is None or tgt_hash is None:
+                entry.action = FileAction.ERROR
+                entry.reason = failures.get(src_key) or failures.get(
+                    tgt_key, "Hash failed"
+                )
+            elif src_hash != tgt_hash:
+                entry.action = FileAction.UPDATED
+            else:
+                entry.action = FileAction.SKIPPED
+
+    def _load_hash_cache(self, target_base: Path):
+        """Persistierten Hash-Cache aus dem Zielverzeichnis laden."""
+        self._hash_cache_path = target_base / ".backup_hash_cache.json"
+        self._hash_cache_dirty = False
+        self._hash_keys_used = set()
+        if self._hash_cache_path.exists():
+            try:
+                with open(self._hash_cache_path, "r", encoding="utf-8") as fh:
+                    loaded = json.load(fh)
+                # Auch gültiges JSON kann die falsche Form haben (z.B.
+                # eine Liste) – nur ein Dict ist ein brauchbarer Cache
+                self._hash_cache = loaded if isinstance(loaded, dict) else {}
+            except (json.JSONDecodeError, IOError):
+                self._hash_cache = {}  # Defekter Cache: neu aufbauen
+
+    def _save_hash_cache(self):
+        """Hash-Cache zurückschreiben (nur wenn sich etwas geändert hat)."""
+        if self._hash_cache_path is None:
+            return
+        # Nur Schlüssel behalten, die dieser Lauf tatsächlich nachgefragt
+        # hat – jede geänderte oder gelöschte Datei hinterlässt sonst
+        # einen toten (Pfad, Größe, mtime)-Eintrag pro Lauf
+        pruned = {
+            k: v for k, v in self._hash_cache.items()
+            if k in self._hash_keys_used
+        }
+        if not self._hash_cache_dirty and len(pruned) == len(self._hash_cache):
+            return
+        self._hash_cache = pruned
+        try:
+            self._hash_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._hash_cache_path, "w", encoding="utf-8") as fh:
+                json.dump(self._hash_cache, fh)
+            self._hash_cache_dirty = False
+        except IOError:
+            pass  # Cache ist nur eine Optimierung – Fehler nicht fatal
+
+    # ------------------------------------------------------------------
+    def _is_excluded(self, name: str, rel: str) -> bool:
         """Prüfen, ob die Datei durch ein Ausschlussmuster gefiltert wird."""
-        rel = file_path.relative_to(source_root)
-        name = file_path.name
-        for pat in self.excludes:
-            if fnmatch.fnmatch(name, pat):
-                return True
-            if fnmatch.fnmatch(str(rel), pat):
-                return True
-            for part in rel.parts:
-                if fnmatch.fnmatch(part, pat):
-                    return True
-        return False
+        if self._exclude_re is None:
+            return False
+        if self._exclude_re.match(name):
+            return True
+        return bool(self._exclude_re.match(rel))
+
+    def _is_excluded_dir(self, name: str) -> bool:
+        """Prüfen, ob ein Ordnername komplett ausgeschlossen ist."""
+        return self._exclude_re is not None and bool(
+            self._exclude_re.match(name)
+        )
 
     # ------------------------------------------------------------------
     @staticmethod
-    def _file_hash(path: Path, block_size: int = 65536) -> str:
-        """SHA-256-Hash einer Datei blockweise berechnen."""
-        h = hashlib.sha256()
+    def _hash_key(path: str, size: int, mtime_ns: int) -> str:
+        """Cache-Schlüssel für einen Datei-Hash bilden."""
+        return f"{_HASH_ALGO}|{path}|{size}|{mtime_ns}"
+
+    @staticmethod
+    def _file_hash(path: str | Path, block_size: int = 1024 * 1024) -> str:
+        """Inhalts-Hash einer Datei berechnen (BLAKE3, sonst SHA-256)."""
+        if _blake3 is not None:
+            h = _blake3()
+            if hasattr(h, "update_mmap"):
+                # mappt die Datei und hasht intern multithreaded
+                h.update_mmap(os.fspath(path))
+                return h.hexdigest()
+            with open(path, "rb") as f:
+                while True:
+                    chunk = f.read(block_size)
+                    if not chunk:
+                        break
+                    h.update(chunk)
+            return h.hexdigest()
+
         with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size > 1 << 20:
+                # Große Dateien über mmap hashen: ein Syscall statt
+                # N read-Aufrufe, der Kernel prefetcht sequenziell.
+                # Für kleine Dateien lohnt der mmap-Fixkostenanteil nicht.
+                with mmap.mmap(
+                    f.fileno(), 0, access=mmap.ACCESS_READ
+                ) as mm:
+                    try:
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    except (AttributeError, ValueError):
+                        pass  # z.B. unter Windows nicht verfügbar
+                    h = hashlib.sha256()
+                    h.update(mm)
+                    return h.hexdigest()
+
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                # C-Schleife in hashlib: kein Python-Overhead pro Block,
+                # gibt während des Hashens den GIL frei
+                return hashlib.file_digest(f, "sha256").hexdigest()
+
+            # Fallback für ältere Python-Versionen: readinto in einen
+            # wiederverwendeten Puffer statt Allokation pro Block
+            h = hashlib.sha256()
+            buf = bytearray(block_size)
+            view = memoryview(buf)
             while True:
-                chunk = f.read(block_size)
-                if not chunk:
+                n = f.readinto(buf)
+                if not n:
                     break
-                h.update(chunk)
-        return h.hexdigest()
+                h.update(view[:n])
+            return h.hexdigest()
@@ -5,12 +5,32 @@ Stellt eine ``DiskUsage``-Datenklasse und eine Hilfsfunktion bereit,
 um den belegten und freien Speicherplatz eines Pfades abzufragen.
 """
 
+import functools
 import shutil
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 
+# slots=True erfordert Python 3.10 – auf 3.9 normaler Decorator,
+# damit der Import dort nicht scheitert
+if sys.version_info >= (3, 10):
+    _slots_dataclass = dataclass(slots=True)
+else:
+    _slots_dataclass = dataclass
 
-@dataclass
+
+@functools.lru_cache(maxsize=4096)
+def _format_size_cached(size_bytes: int) -> str:
+    """Bytes formatieren – gecacht, da sich Größen stark wiederholen."""
+    v = float(size_bytes)
+    for unit in ("B", "KB", "MB", "GB", "TB"):
+        if abs(v) < 1024:
+            return f"{v:.1f} {unit}"
+        v /= 1024
+    return f"{v:.1f} PB"
+
+
+@_slots_dataclass
 class DiskUsage:
     """Speicherplatz-Daten: Gesamtgröße, belegt, frei (in Bytes)."""
 
@@ -31,12 +51,7 @@ class DiskUsage:
     @staticmethod
     def format_size(size_bytes: int) -> str:
         """Bytes in lesbares Format umwandeln (z.B. ``'12.3 MB'``)."""
-        v = float(size_bytes)
-        for unit in ("B", "KB", "MB", "GB", "TB"):
-            if abs(v) < 1024:
-                return f"{v:.1f} {unit}"
-            v /= 1024
-        return f"{v:.1f} PB"
+        return _format_size_cached(int(size_bytes))
 
 
 def get_disk_usage(path: Path) -> DiskUsage:
@@ -12,8 +12,18 @@ Sprache erscheint automatisch im GUI-Menü.
 from __future__ import annotations
 
 import json
+import re
 from pathlib import Path
 
+try:
+    import orjson  # C-Parser, 3-10x schneller als Stdlib-json
+except ImportError:  # optional – Stdlib-json genügt funktional
+    orjson = None
+
+# Sprachname direkt aus dem Dateitext greifen, ohne die komplette
+# Locale-Datei zu parsen (available_languages braucht nur diesen Wert)
+_LANG_NAME_RE = re.compile(r'"_language_name"\s*:\s*"([^"]+)"')
+
 
 class I18n:
     """Übersetzungsmanager für die Benutzeroberfläche.
@@ -27,16 +37,27 @@ class I18n:
     def __init__(self, locales_dir: Path, language: str = "en"):
         self.locales_dir = locales_dir
         self.strings: dict[str, str] = {}
+        self._has_fmt: dict[str, bool] = {}
+        # Cache für parameterlose Abfragen (der häufigste Fall bei
+        # _retranslate und den Tabellen-Updates); wird bei load() geleert
+        self._t_cache: dict[str, str] = {}
         self.language = language
         self.load(language)
 
     def load(self, language: str):
         """Sprachdatei für den gegebenen Code laden."""
         self.language = language
+        self._t_cache.clear()
         path = self.locales_dir / f"{language}.json"
         if path.exists():
-            with open(path, "r", encoding="utf-8") as fh:
-                self.strings = json.load(fh)
+            raw = path.read_bytes()
+            if orjson is not None:
+                self.strings = orjson.loads(raw)
+            else:
+                self.strings = json.loads(raw.decode("utf-8"))
+            # Vorab merken, welche Texte Platzhalter enthalten – erspart
+            # den format-Aufruf für Strings ohne "{...}"
+            self._has_fmt = {k: "{" in v for k, v in self.strings.items()}
 
     def t(self, key: str, **kwargs) -> str:
         """Übersetzung für *key* zurückgeben.
@@ -45,8 +66,14 @@ class I18n:
         Keyword-Argumente ersetzt.  Fehlt ein Schlüssel in der aktuellen
         Sprache, wird der Schlüsselname selbst zurückgegeben.
         """
+        if not kwargs:
+            value = self._t_cache.get(key)
+            if value is None:
+                value = self._t_cache[key] = self.strings.get(key, key)
+            return value
+
         value = self.strings.get(key, key)
-        if kwargs:
+        if self._has_fmt.get(key, True):
             try:
                 value = value.format(**kwargs)
             except (KeyError, IndexError):
@@ -59,9 +86,14 @@ class I18n:
         for f in sorted(self.locales_dir.glob("*.json")):
             code = f.stem
             try:
-                with open(f, "r", encoding="utf-8") as fh:
-                    data = json.load(fh)
-                name = data.get("_language_name", code)
+                text = f.read_text(encoding="utf-8")
+                # Regex-Suche statt Vollparse: wir brauchen nur den
+                # Anzeigenamen, nicht alle Übersetzungen
+                m = _LANG_NAME_RE.search(text)
+                if m:
+                    name = m.group(1)
+                else:
+                    name = json.loads(text).get("_language_name", code)
             except Exception:
                 name = code
             langs.append((code, name))
@@ -13,10 +13,14 @@ Sowie den ``SettingsDialog`` (QDialog) zum Bearbeiten der Konfiguration.
 from __future__ import annotations
 
 import platform
+import time
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer
 from PySide6.QtGui import QAction, QActionGroup, QColor
 from PySide6.QtWidgets import (
     QAbstractItemView,
@@ -36,19 +40,165 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QProgressBar,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
-from core.backup_engine import BackupWorker, ScanWorker
+# BackupWorker/ScanWorker/DiffEngine werden erst in _on_scan bzw.
+# _on_start_backup importiert: kleinerer Start-Arbeitssatz, spürbar
+# beim Kaltstart von langsamem USB-Flash
 from core.config_manager import ConfigManager
-from core.diff_engine import DiffEngine, FileAction
+from core.diff_engine import FileAction
 from core.disk_info import DiskUsage, get_disk_usage
 from core.i18n import I18n
 from core.logger import BackupLogger
 
+if TYPE_CHECKING:
+    # Nur für Annotationen – zur Laufzeit bleiben die Importe lazy
+    from core.backup_engine import BackupWorker, ScanWorker
+
+# Aktionen, die tatsächlich kopiert werden – als frozenset einmal gebaut,
+# Membership-Test in O(1) statt Tupel-Neubau pro Eintrag
+_COPY_ACTIONS = frozenset({FileAction.NEW, FileAction.UPDATED})
+
+
+@lru_cache(maxsize=8192)
+def _fmt_mtime(minute: int) -> str:
+    """Zeitstempel (auf Minuten gerundet) formatieren – gecacht.
+
+    Die Anzeige ist ohnehin minutengenau, und viele Dateien eines
+    Ordners teilen sich dieselbe Minute – der Cache erspart damit die
+    beiden Objekt-Allokationen von fromtimestamp+strftime pro Zelle.
+    """
+    return datetime.fromtimestamp(minute * 60).strftime("%Y-%m-%d %H:%M")
+
+
+def qthrottled(callback, timeout: int, parent):
+    """Slot-Wrapper: *callback* höchstens alle *timeout* ms ausführen.
+
+    Leading+Trailing-Drosselung (wie superqt/KDToolbox): der erste Aufruf
+    geht sofort durch, weitere Aufrufe innerhalb der Sperrzeit werden
+    zusammengefasst und beim Ablauf des Timers mit den zuletzt
+    gesehenen Argumenten nachgeholt.  Verhindert, dass schnelle Worker
+    die GUI mit Paint-Events fluten.
+
+    Der zurückgegebene Slot hat eine ``cancel()``-Methode, die den
+    Timer stoppt und den ausstehenden Nachzügler verwirft – nötig am
+    Ende eines Laufs, damit kein verspäteter Aufruf bereits geleerte
+    Anzeigen wieder überschreibt.
+    """
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(timeout)
+    pending: list[tuple] = []
+
+    def _fire():
+        if pending:
+            args = pending.pop()
+            pending.clear()
+            callback(*args)
+
+    timer.timeout.connect(_fire)
+
+    def _slot(*args):
+        if timer.isActive():
+            pending[:] = [args]
+        else:
+            callback(*args)
+            timer.start()
+
+    def _cancel():
+        timer.stop()
+        pending.clear()
+
+    _slot.cancel = _cancel
+    return _slot
+
+
+# ======================================================================
+#  Vorschau-Modell
+# ======================================================================
+class EntriesModel(QAbstractTableModel):
+    """Tabellenmodell für die Vorschau-Liste.
+
+    Hält die FileEntry-Liste direkt und liefert Zelleninhalte erst beim
+    Anzeigen (lazy) – im Gegensatz zum früheren QTableWidget werden
+    keine Items für alle Zeilen vorab erzeugt, so dass der Aufwand nur
+    von den sichtbaren Zeilen abhängt, nicht von der Scan-Größe.
+    """
+
+    COLUMN_COUNT = 4
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries: list = []
+        self._headers: list[str] = ["", "", "", ""]
+        self._action_names: dict = {}
+        self._action_colors = {
+            FileAction.NEW: QColor(0, 140, 0),
+            FileAction.UPDATED: QColor(190, 140, 0),
+            FileAction.SKIPPED: QColor(140, 140, 140),
+            FileAction.ERROR: QColor(200, 0, 0),
+        }
+
+    # --- Daten setzen -------------------------------------------------
+    def set_entries(self, entries: list):
+        """Komplette Eintragsliste austauschen (ein Model-Reset)."""
+        self.beginResetModel()
+        self._entries = entries
+        self.endResetModel()
+
+    def set_translations(self, headers: list[str], action_names: dict):
+        """Spaltentitel und Aktionsnamen nach Sprachwechsel setzen."""
+        self._headers = headers
+        self._action_names = action_names
+        self.headerDataChanged.emit(
+            Qt.Orientation.Horizontal, 0, self.COLUMN_COUNT - 1
+        )
+        if self._entries:
+            # Aktionsspalte neu zeichnen lassen
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(len(self._entries) - 1, 0)
+            )
+
+    # --- Qt-Modellschnittstelle ---------------------------------------
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return self.COLUMN_COUNT
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self._headers[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._entries[index.row()]
+        col = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return self._action_names.get(entry.action, "?")
+            if col == 1:
+                return entry.relative_path
+            if col == 2:
+                if entry.source_size:
+                    return DiskUsage.format_size(entry.source_size)
+                return "-"
+            if col == 3:
+                if entry.source_mtime > 0:
+                    return _fmt_mtime(int(entry.source_mtime) // 60)
+                return "-"
+        elif role == Qt.ItemDataRole.ForegroundRole and col == 0:
+            return self._action_colors.get(entry.action)
+        return None
+
 
 # ======================================================================
 #  Hauptfenster
@@ -73,6 +223,18 @@ class MainWindow(QMainWindow):
         self.entries: list = []
         self.backup_worker: BackupWorker | None = None
         self.scan_worker: ScanWorker | None = None
+        # Rechnername ändert sich nicht – einmal abfragen statt bei
+        # jedem Status-Refresh (platform.node() ist ein Syscall)
+        self._node = platform.node()
+        # Speicherplatz-Abfrage (statvfs) höchstens alle 2 s
+        self._disk_cache: tuple[float, DiskUsage] | None = None
+        # Config-Schreibzugriffe entprellen: jeder save() schreibt die
+        # komplette JSON auf den Stick – bei schnell hintereinander
+        # folgenden Änderungen genügt der letzte Stand nach 500 ms
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self.config.save)
 
         self.setMinimumSize(800, 600)
         self.resize(
@@ -124,10 +286,15 @@ class MainWindow(QMainWindow):
             act.setData(code)
             if code == self.i18n.language:
                 act.setChecked(True)
-            act.triggered.connect(lambda _checked, c=code: self._change_language(c))
             self.lang_group.addAction(act)
             self.lang_menu.addAction(act)
 
+        # Eine Verbindung für alle Sprach-Actions statt einer Lambda-
+        # Closure pro Eintrag; der Sprachcode steckt in action.data()
+        self.lang_group.triggered.connect(
+            lambda action: self._change_language(action.data())
+        )
+
         self.settings_action = menubar.addAction("")
         self.settings_action.triggered.connect(self._open_settings)
 
@@ -197,19 +364,26 @@ class MainWindow(QMainWindow):
         self.lbl_preview.setStyleSheet("font-weight:bold; font-size:14px")
         vl.addWidget(self.lbl_preview)
 
-        # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
+        # Table (View + Modell: Zellen werden erst beim Anzeigen erzeugt)
+        self.model = EntriesModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.setSelectionBehavior(
             QAbstractItemView.SelectionBehavior.SelectRows
         )
         self.table.setAlternatingRowColors(True)
         hdr = self.table.horizontalHeader()
-        hdr.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        # Feste Breiten statt ResizeToContents: Aktion, Größe und Datum
+        # haben bekannte Maximalbreiten, und ResizeToContents müsste
+        # dafür jede Zeile vermessen (O(N) bei großen Scans)
+        hdr.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
         hdr.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        hdr.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        hdr.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
+        hdr.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
+        hdr.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)
+        self.table.setColumnWidth(0, 90)
+        self.table.setColumnWidth(2, 110)
+        self.table.setColumnWidth(3, 130)
         vl.addWidget(self.table, 1)
 
         # Summary label
@@ -256,18 +430,30 @@ class MainWindow(QMainWindow):
         self.btn_scan.setText(t("btn_scan"))
         self.btn_settings.setText(t("btn_settings"))
         self.lbl_preview.setText(t("preview_title"))
-        self.table.setHorizontalHeaderLabels(
-            [t("col_action"), t("col_path"), t("col_size"), t("col_modified")]
+        # Aktionsnamen einmal pro Sprachwechsel auflösen; Modell und
+        # Zusammenfassung greifen auf dasselbe Dictionary zu
+        self._action_names = {
+            FileAction.NEW: t("action_new"),
+            FileAction.UPDATED: t("action_updated"),
+            FileAction.SKIPPED: t("action_skipped"),
+            FileAction.ERROR: t("action_error"),
+        }
+        self.model.set_translations(
+            [t("col_action"), t("col_path"), t("col_size"), t("col_modified")],
+            self._action_names,
         )
         self.btn_backup.setText(t("btn_start_backup"))
         self.btn_cancel.setText(t("btn_cancel"))
         self.status_label.setText(t("statusbar_ready"))
+        # Beschriftungen der Speicherplatz-Anzeige einmal pro Sprach-
+        # wechsel auflösen statt bei jedem Panel-Update
+        self._disk_labels = (t("disk_free"), t("disk_used"), t("disk_total"))
 
     def _change_language(self, lang_code: str):
         """Sprache wechseln, Config speichern und UI aktualisieren."""
         self.i18n.load(lang_code)
         self.config.set("language", lang_code)
-        self.config.save()
+        self._save_timer.start()
         self._retranslate()
         self._update_status_panel()
         if self.entries:
@@ -281,7 +467,7 @@ class MainWindow(QMainWindow):
         return (
             self.app_root
             / self.config.get("target_subfolder", "Backups")
-            / platform.node()
+            / self._node
         )
 
     def _update_status_panel(self):
@@ -301,14 +487,22 @@ class MainWindow(QMainWindow):
 
         self.lbl_target_v.setText(str(self._get_target_path()))
 
-        usage = get_disk_usage(self.app_root)
+        now = time.monotonic()
+        if self._disk_cache is not None and now - self._disk_cache[0] < 2.0:
+            usage = self._disk_cache[1]
+        else:
+            usage = get_disk_usage(self.app_root)
+            self._disk_cache = (now, usage)
         self.disk_bar.setMaximum(100)
         self.disk_bar.setValue(int(usage.used_percent))
         self.disk_bar.setFormat(f"{usage.used_percent:.1f}%")
         self.lbl_disk_detail.setText(
-            f"{t('disk_free')}: {DiskUsage.format_size(usage.free)}\n"
-            f"{t('disk_used')}: {DiskUsage.format_size(usage.used)}\n"
-            f"{t('disk_total')}: {DiskUsage.format_size(usage.total)}"
+            "\n".join(
+                f"{lbl}: {DiskUsage.format_size(v)}"
+                for lbl, v in zip(
+                    self._disk_labels, (usage.free, usage.used, usage.total)
+                )
+            )
         )
 
         self.lbl_log_v.setText(info.get("log_file", "-") if info else "-")
@@ -325,9 +519,12 @@ class MainWindow(QMainWindow):
             )
             return
 
+        from core.backup_engine import ScanWorker
+        from core.diff_engine import DiffEngine
+
         self.btn_scan.setEnabled(False)
         self.btn_backup.setEnabled(False)
-        self.table.setRowCount(0)
+        self.model.set_entries([])
         self.lbl_summary.setText("")
         self.status_label.setText(self.i18n.t("statusbar_scanning"))
 
@@ -352,9 +549,7 @@ class MainWindow(QMainWindow):
         self._populate_table()
         self.btn_scan.setEnabled(True)
 
-        actionable = [
-            e for e in entries if e.action in (FileAction.NEW, FileAction.UPDATED)
-        ]
+        actionable = [e for e in entries if e.action in _COPY_ACTIONS]
         self.btn_backup.setEnabled(len(actionable) > 0)
         self.lbl_progress_file.setText("")
         self.status_label.setText(self.i18n.t("statusbar_ready"))
@@ -363,47 +558,18 @@ class MainWindow(QMainWindow):
     #  Vorschau-Tabelle befüllen
     # ------------------------------------------------------------------
     def _populate_table(self):
-        """Vorschau-Tabelle mit den Scan-Ergebnissen befüllen."""
+        """Vorschau-Modell neu setzen und Zusammenfassung berechnen."""
         t = self.i18n.t
-        names = {
-            FileAction.NEW: t("action_new"),
-            FileAction.UPDATED: t("action_updated"),
-            FileAction.SKIPPED: t("action_skipped"),
-            FileAction.ERROR: t("action_error"),
-        }
-        colors = {
-            FileAction.NEW: QColor(0, 140, 0),
-            FileAction.UPDATED: QColor(190, 140, 0),
-            FileAction.SKIPPED: QColor(140, 140, 140),
-            FileAction.ERROR: QColor(200, 0, 0),
-        }
+        names = self._action_names
 
-        self.table.setRowCount(len(self.entries))
-        counts = {a: 0 for a in FileAction}
-        total_copy_size = 0
-
-        for i, entry in enumerate(self.entries):
-            # Action
-            item = QTableWidgetItem(names.get(entry.action, "?"))
-            item.setForeground(colors.get(entry.action, QColor(0, 0, 0)))
-            self.table.setItem(i, 0, item)
-            # Path
-            self.table.setItem(i, 1, QTableWidgetItem(str(entry.relative_path)))
-            # Size
-            sz = DiskUsage.format_size(entry.source_size) if entry.source_size else "-"
-            self.table.setItem(i, 2, QTableWidgetItem(sz))
-            # Modified
-            if entry.source_mtime > 0:
-                mt = datetime.fromtimestamp(entry.source_mtime).strftime(
-                    "%Y-%m-%d %H:%M"
-                )
-            else:
-                mt = "-"
-            self.table.setItem(i, 3, QTableWidgetItem(mt))
+        self.model.set_entries(self.entries)
 
-            counts[entry.action] = counts.get(entry.action, 0) + 1
-            if entry.action in (FileAction.NEW, FileAction.UPDATED):
-                total_copy_size += entry.source_size
+        # Counter ist C-implementiert; zusammen mit der Generator-Summe
+        # bleibt pro Eintrag kaum Python-Bytecode übrig
+        counts = Counter(e.action for e in self.entries)
+        total_copy_size = sum(
+            e.source_size for e in self.entries if e.action in _COPY_ACTIONS
+        )
 
         parts = [
             f"{names[FileAction.NEW]}: {counts[FileAction.NEW]}",
@@ -421,10 +587,7 @@ class MainWindow(QMainWindow):
     def _on_start_backup(self):
         """Backup starten: Speicherplatz prüfen, bestätigen, Worker starten."""
         t = self.i18n.t
-        actionable = [
-            e for e in self.entries
-            if e.action in (FileAction.NEW, FileAction.UPDATED)
-        ]
+        actionable = [e for e in self.entries if e.action in _COPY_ACTIONS]
         if not actionable:
             return
 
@@ -462,10 +625,17 @@ class MainWindow(QMainWindow):
             self.config.get("sources", []), str(self._get_target_path())
         )
 
+        from core.backup_engine import BackupWorker
+
         self.backup_worker = BackupWorker(self.entries)
-        self.backup_worker.progress.connect(self._on_backup_progress)
-        self.backup_worker.file_done.connect(self._on_file_done)
-        self.backup_worker.speed_update.connect(self._on_speed_update)
+        # Anzeige-Slots gedrosselt anbinden; das Log (file_done_batch)
+        # bleibt direkt, damit keine Einträge verloren gehen.  Referenzen
+        # behalten, um die Drossel-Timer am Laufende zu stoppen.
+        self._throttled_progress = qthrottled(self._on_backup_progress, 50, self)
+        self._throttled_speed = qthrottled(self._on_speed_update, 50, self)
+        self.backup_worker.progress.connect(self._throttled_progress)
+        self.backup_worker.file_done_batch.connect(self._on_files_done)
+        self.backup_worker.speed_update.connect(self._throttled_speed)
         self.backup_worker.finished_backup.connect(self._on_backup_finished)
         self.backup_worker.start()
 
@@ -475,10 +645,11 @@ class MainWindow(QMainWindow):
         self.lbl_progress_file.setText(filename)
         self.lbl_progress_stats.setText(f"{current} / {total}")
 
-    def _on_file_done(self, filename: str, status: str, size: int):
-        """Einzelne Datei-Aktion ins Log schreiben."""
-        action_str = "COPIED" if status == "OK" else status
-        self.logger.log_file(filename, action_str, size)
+    def _on_files_done(self, batch: list):
+        """Gebündelte Datei-Aktionen ins Log schreiben."""
+        for filename, status, size in batch:
+            action_str = "COPIED" if status == "OK" else status
+            self.logger.log_file(filename, action_str, size)
 
     def _on_speed_update(self, bps: float):
         """Geschwindigkeitsanzeige aktualisieren."""
@@ -494,6 +665,11 @@ class MainWindow(QMainWindow):
     def _on_backup_finished(self, stats: dict):
         """Backup abgeschlossen – Ergebnis-Dialog anzeigen, Log abschließen."""
         t = self.i18n.t
+        # Ausstehende Drossel-Nachzügler verwerfen: der letzte
+        # progress-Emit des Workers könnte sonst nach dem Leeren der
+        # Anzeigen noch einmal "N / N" samt Dateiname hineinschreiben
+        self._throttled_progress.cancel()
+        self._throttled_speed.cancel()
         self.logger.end_session(stats)
 
         # Unlock UI
@@ -530,7 +706,7 @@ class MainWindow(QMainWindow):
         """Einstellungsdialog öffnen und bei OK die Config speichern."""
         dlg = SettingsDialog(self.config, self.i18n, self)
         if dlg.exec() == QDialog.DialogCode.Accepted:
-            self.config.save()
+            self._save_timer.start()
             self._retranslate()
             self._update_status_panel()
 
@@ -541,6 +717,9 @@ class MainWindow(QMainWindow):
         """Beim Schließen: Fenstergröße speichern, laufendes Backup abbrechen."""
         self.config.set("window_width", self.width())
         self.config.set("window_height", self.height())
+        # Synchron speichern: ein noch laufender Entprell-Timer würde
+        # nach dem Schließen nicht mehr feuern
+        self._save_timer.stop()
         self.config.save()
         if self.backup_worker and self.backup_worker.isRunning():
             self.backup_worker.cancel()
@@ -27,9 +27,13 @@ def main():
     app_root = get_app_root()
     os.chdir(str(app_root))
 
-    # Benötigte Unterordner sicherstellen
+    # Benötigte Unterordner sicherstellen – ein scandir statt drei
+    # mkdir-Aufrufe; auf langsamen USB-Sticks spart das spürbar
+    # Syscall-Latenz beim Start
+    existing = {e.name for e in os.scandir(app_root) if e.is_dir()}
     for sub in ("Config", "Backups", "Logs"):
-        (app_root / sub).mkdir(exist_ok=True)
+        if sub not in existing:
+            (app_root / sub).mkdir(exist_ok=True)
 
     from PySide6.QtWidgets import QApplication
 